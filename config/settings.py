@@ -200,5 +200,18 @@ MATHESAR_UI_BUILD_LOCATION = os.path.join(BASE_DIR, 'mathesar/static/mathesar/')
 MATHESAR_MANIFEST_LOCATION = os.path.join(MATHESAR_UI_BUILD_LOCATION, 'manifest.json')
 MATHESAR_CLIENT_DEV_URL = 'http://localhost:3000'
 MATHESAR_CAPTURE_UNHANDLED_EXCEPTION = decouple_config('CAPTURE_UNHANDLED_EXCEPTION', default=True)
+# Connection pool of the SQLAlchemy engines used for user databases. Each worker process keeps
+# its own pool, so the pool size should cover the number of threads serving requests per worker.
+# The size defaults are SQLAlchemy's. Connections are replaced after DB_POOL_RECYCLE seconds, so
+# that one dropped by the server while idle is rarely handed out. DB_POOL_PRE_PING checks every
+# connection before use instead, which costs a round trip per checkout, so it's off by default.
+MATHESAR_DB_POOL_SIZE = decouple_config('DB_POOL_SIZE', default=5, cast=int)
+MATHESAR_DB_MAX_OVERFLOW = decouple_config('DB_MAX_OVERFLOW', default=10, cast=int)
+MATHESAR_DB_POOL_RECYCLE = decouple_config('DB_POOL_RECYCLE', default=300, cast=int)
+MATHESAR_DB_POOL_PRE_PING = decouple_config('DB_POOL_PRE_PING', default=False, cast=bool)
+# Records list requests that need to count records do so on a shared pool of this many threads
+# per worker process, on a connection of their own, while the page is fetched. When they're all
+# busy, the count is done after the page on the request's thread instead.
+MATHESAR_DB_COUNT_THREADS = decouple_config('DB_COUNT_THREADS', default=2, cast=int)
 
 STATICFILES_DIRS = [MATHESAR_UI_BUILD_LOCATION]
@@ -2,6 +2,7 @@ import warnings
 
 from pglast import Node, parse_sql
 from sqlalchemy import MetaData, Table, and_, asc, cast, select, text
+from sqlalchemy import column as sa_column, table as sa_table
 
 from db.columns.exceptions import DynamicDefaultWarning
 from db.tables.operations.select import reflect_table_from_oid
@@ -63,6 +64,30 @@ def get_column_attnums_from_table(table_oid, engine, connection_to_use=None):
     return results
 
 
+def get_column_names_by_attnum(table_oid, engine, connection_to_use=None):
+    """
+    Returns a dictionary mapping the attnum of each column of the table to its name, ignoring
+    system and removed columns.
+    """
+    # pg_attribute is described by hand instead of being reflected, since this runs often.
+    pg_attribute = sa_table(
+        "pg_attribute",
+        sa_column("attrelid"),
+        sa_column("attnum"),
+        sa_column("attname"),
+        sa_column("attisdropped"),
+    )
+    sel = select(pg_attribute.c.attnum, pg_attribute.c.attname).where(
+        and_(
+            pg_attribute.c.attrelid == table_oid,
+            pg_attribute.c.attnum > 0,
+            pg_attribute.c.attisdropped.is_(False)
+        )
+    )
+    results = execute_statement(engine, sel, connection_to_use).fetchall()
+    return {attnum: name for attnum, name in results}
+
+
 def _get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use=None):
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
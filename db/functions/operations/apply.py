@@ -1,11 +1,11 @@
 from db.functions.base import DBFunction
 from db.functions.exceptions import ReferencedColumnsDontExist
 from db.functions.packed import DBFunctionPacked
-from db.functions.operations.deserialize import get_db_function_from_ma_function_spec
+from db.functions.operations.deserialize import get_cached_db_function_from_ma_function_spec
 
 
 def apply_db_function_spec_as_filter(relation, ma_function_spec):
-    db_function = get_db_function_from_ma_function_spec(ma_function_spec)
+    db_function = get_cached_db_function_from_ma_function_spec(ma_function_spec)
     return apply_db_function_as_filter(relation, db_function)
 
 
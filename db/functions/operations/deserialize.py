@@ -1,3 +1,6 @@
+import json
+from functools import lru_cache
+
 from db.functions.base import Literal, ColumnName
 from db.functions.known_db_functions import known_db_functions
 from db.functions.exceptions import UnknownDBFunctionID, BadDBFunctionFormat
@@ -40,6 +43,25 @@ def get_db_function_from_ma_function_spec(spec):
         raise BadDBFunctionFormat from e
 
 
+def get_cached_db_function_from_ma_function_spec(spec):
+    """
+    Same as get_db_function_from_ma_function_spec, but the deserialized DBFunction is reused
+    for repeated identical specs, e.g. when the same filter is used for counting and fetching
+    records. The returned DBFunction shouldn't be modified.
+    """
+    try:
+        serialized_spec = json.dumps(spec, sort_keys=True)
+    except TypeError:
+        # Specs with values JSON can't represent aren't cached.
+        return get_db_function_from_ma_function_spec(spec)
+    return _get_db_function_from_serialized_spec(serialized_spec)
+
+
+@lru_cache(maxsize=256)
+def _get_db_function_from_serialized_spec(serialized_spec):
+    return get_db_function_from_ma_function_spec(json.loads(serialized_spec))
+
+
 def _process_parameter(parameter, parent_db_function_subclass):
     if isinstance(parameter, dict):
         # A dict parameter is a nested function call.
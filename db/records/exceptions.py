@@ -12,3 +12,7 @@ class GroupFieldNotFound(FieldNotFound):
 
 class InvalidGroupType(Exception):
     pass
+
+
+class BadCursorFormat(Exception):
+    pass
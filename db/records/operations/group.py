@@ -1,5 +1,4 @@
 from enum import Enum
-import json
 import logging
 from sqlalchemy import select, func, and_, case, literal
 
@@ -238,9 +237,12 @@ def extract_group_metadata(
         *(_get_record_pieces(record) for record in record_dictionaries)
     )
 
-    reduced_groups = sorted(
-        [json.loads(blob) for blob in set([json.dumps(group) for group in group_tup])],
-        key=lambda x: x[GroupMetadataField.GROUP_ID.value] if x else None
-    )
+    # Every record of a group carries the same group metadata (it's computed by window functions
+    # over the group), so keeping one copy per group id is enough.
+    groups_by_id = {
+        group[GroupMetadataField.GROUP_ID.value]: group
+        for group in group_tup if group is not None
+    }
+    reduced_groups = [groups_by_id[group_id] for group_id in sorted(groups_by_id)]
 
-    return list(record_tup), reduced_groups if reduced_groups != [None] else None
+    return list(record_tup), reduced_groups if reduced_groups else None
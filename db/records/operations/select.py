@@ -1,12 +1,14 @@
-from sqlalchemy import select, func
+from sqlalchemy import BigInteger, select, func, and_, or_, tuple_, cast, false
+from sqlalchemy import column as sa_column, table as sa_table
 from sqlalchemy_filters import apply_sort
 
 from db.functions.operations.apply import apply_db_function_spec_as_filter
 from db.columns.base import MathesarColumn
+from db.records import exceptions as records_exceptions
 from db.records.operations import group
 from db.tables.utils import get_primary_key_column
 from db.types.operations.cast import get_column_cast_expression
-from db.utils import execute_query
+from db.utils import execute_query, iter_query_results
 
 
 def _get_duplicate_only_cte(table, duplicate_columns):
@@ -28,6 +30,95 @@ def _sort_and_filter(query, order_by, filter):
     return query
 
 
+def _get_field_name(field):
+    return field if isinstance(field, str) else field.name
+
+
+def _is_nullable(column):
+    # Columns which aren't table columns (e.g. labeled expressions) are assumed to be nullable.
+    return getattr(column, 'nullable', True)
+
+
+def _sorts_nulls_first(sort):
+    """
+    Returns whether NULLs come first in the sort, as requested by its `nullsfirst` or
+    `nullslast` option, or else the way PostgreSQL sorts them by default, i.e. last when sorting
+    ascending and first when sorting descending.
+    """
+    if sort.get('nullsfirst'):
+        return True
+    if sort.get('nullslast'):
+        return False
+    return sort.get('direction') == 'desc'
+
+
+def _get_after_value_filter(column, value, descending, nulls_first):
+    """
+    Returns an expression matching the values of the column which are sorted strictly after
+    `value`, with NULLs sorted first or last according to `nulls_first`.
+    """
+    if value is None:
+        return column.isnot(None) if nulls_first else false()
+    after_value = column < value if descending else column > value
+    if not nulls_first and _is_nullable(column):
+        return or_(after_value, column.is_(None))
+    return after_value
+
+
+def _get_equal_value_filter(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _get_keyset_filter(relation, order_by, after):
+    """
+    Returns an expression matching the rows of the relation which come strictly after the row
+    whose sort key values are given by `after`, according to `order_by`.
+    """
+    if len(after) != len(order_by):
+        raise records_exceptions.BadCursorFormat(
+            f"Cursor has {len(after)} values, but the ordering has {len(order_by)} fields."
+        )
+    sort_columns = [relation.columns[_get_field_name(sort['field'])] for sort in order_by]
+    is_descending = [sort.get('direction') == 'desc' for sort in order_by]
+    is_nulls_first = [_sorts_nulls_first(sort) for sort in order_by]
+    can_compare_rows = (
+        len(set(is_descending)) == 1
+        and None not in after
+        and not any(_is_nullable(column) for column in sort_columns)
+    )
+    if can_compare_rows:
+        # If all fields are sorted in the same direction and can't be NULL, a row value
+        # comparison is equivalent and lets PostgreSQL use a multicolumn index to find the start
+        # of the page.
+        if is_descending[0]:
+            return tuple_(*sort_columns) < tuple_(*after)
+        return tuple_(*sort_columns) > tuple_(*after)
+    clauses = []
+    sort_keys = zip(sort_columns, after, is_descending, is_nulls_first)
+    for i, (column, value, descending, nulls_first) in enumerate(sort_keys):
+        preceding_equal = [
+            _get_equal_value_filter(preceding_column, preceding_value)
+            for preceding_column, preceding_value in zip(sort_columns[:i], after[:i])
+        ]
+        clauses.append(
+            and_(*preceding_equal, _get_after_value_filter(column, value, descending, nulls_first))
+        )
+    return or_(*clauses)
+
+
+def _get_deferred_join_query(table, limit, offset, order_by, filter):
+    """
+    Returns a query giving the same page as a plain LIMIT/OFFSET query, but which only reads the
+    primary key columns of the rows skipped by the OFFSET. Full rows are then fetched just for
+    the keys on the requested page.
+    """
+    primary_key_columns = list(table.primary_key.columns)
+    page_keys = _sort_and_filter(select(table), order_by, filter)
+    page_keys = page_keys.with_only_columns(*primary_key_columns).limit(limit).offset(offset)
+    selectable = select(table).where(tuple_(*primary_key_columns).in_(page_keys))
+    return _sort_and_filter(selectable, order_by, None)
+
+
 def get_query(
     table,
     limit,
@@ -36,8 +127,20 @@ def get_query(
     filter=None,
     columns_to_select=None,
     group_by=None,
-    duplicate_only=None
+    duplicate_only=None,
+    after=None,
 ):
+    use_deferred_join = (
+        offset
+        and after is None
+        and group_by is None
+        and not duplicate_only
+        and not columns_to_select
+        and len(table.primary_key.columns) > 0
+    )
+    if use_deferred_join:
+        return _get_deferred_join_query(table, limit, offset, order_by, filter)
+
     if duplicate_only:
         select_target = _get_duplicate_only_cte(table, duplicate_only)
     else:
@@ -48,7 +151,15 @@ def get_query(
     else:
         selectable = select(select_target)
 
-    selectable = _sort_and_filter(selectable, order_by, filter)
+    if after is None:
+        selectable = _sort_and_filter(selectable, order_by, filter)
+    else:
+        # The selectable is wrapped first, since grouping metadata is calculated using window
+        # functions, which must see the rows before the cursor as well.
+        relation = _sort_and_filter(selectable, None, filter).cte()
+        selectable = select(relation).where(_get_keyset_filter(relation, order_by, after))
+        named_order_by = [{**sort, 'field': _get_field_name(sort['field'])} for sort in order_by]
+        selectable = _sort_and_filter(selectable, named_order_by, None)
 
     if columns_to_select:
         selectable = selectable.cte()
@@ -66,6 +177,41 @@ def get_record(table, engine, id_value):
     return result[0] if result else None
 
 
+def get_deterministic_order_by(table, order_by=[]):
+    """
+    Returns an ordering which puts the records of the table in a stable order.
+
+    If no ordering is requested, we order by all primary key columns, or by all columns if there
+    are no primary keys. Otherwise, any primary key columns missing from the requested ordering
+    are appended to it to break ties.
+    """
+    primary_key_names = [str(col.name) for col in table.primary_key.columns]
+    if not order_by:
+        if len(primary_key_names) > 0:
+            return [{'field': name, 'direction': 'asc'} for name in primary_key_names]
+        return [{'field': col, 'direction': 'asc'} for col in table.columns]
+    sorted_field_names = {_get_field_name(sort['field']) for sort in order_by}
+    return order_by + [
+        {'field': name, 'direction': 'asc'}
+        for name in primary_key_names if name not in sorted_field_names
+    ]
+
+
+def get_cursor_values(table, record, order_by=[]):
+    """
+    Returns the sort key values of a record, suitable for passing as the `after` argument of
+    get_records to get the records following it. Returns None for tables without a primary key,
+    since their records can't be ordered unambiguously.
+    """
+    if len(table.primary_key.columns) == 0:
+        return None
+    record = record._asdict() if not isinstance(record, dict) else record
+    return [
+        record[_get_field_name(sort['field'])]
+        for sort in get_deterministic_order_by(table, order_by)
+    ]
+
+
 def get_records(
     table,
     engine,
@@ -75,6 +221,8 @@ def get_records(
     filter=None,
     group_by=None,
     duplicate_only=None,
+    after=None,
+    stream=False,
 ):
     """
     Returns annotated records from a table.
@@ -93,17 +241,13 @@ def get_records(
         group_by:        group.GroupBy object
         duplicate_only:  list of column names; only rows that have duplicates across those rows
                          will be returned
+        after:           list of sort key values, as returned by get_cursor_values; only the
+                         rows after the row with those values will be returned. Used for keyset
+                         pagination instead of offset.
+        stream:          bool, if true an iterator is returned instead of a list, which fetches
+                         the records from the database in batches as it's consumed.
     """
-    if not order_by:
-        # Set default ordering if none was requested
-        if len(table.primary_key.columns) > 0:
-            # If there are primary keys, order by all primary keys
-            order_by = [{'field': str(col.name), 'direction': 'asc'}
-                        for col in table.primary_key.columns]
-        else:
-            # If there aren't primary keys, order by all columns
-            order_by = [{'field': col, 'direction': 'asc'}
-                        for col in table.columns]
+    order_by = get_deterministic_order_by(table, order_by)
 
     query = get_query(
         table=table,
@@ -112,8 +256,11 @@ def get_records(
         order_by=order_by,
         filter=filter,
         group_by=group_by,
-        duplicate_only=duplicate_only
+        duplicate_only=duplicate_only,
+        after=after,
     )
+    if stream:
+        return iter_query_results(engine, query)
     return execute_query(engine, query)
 
 
@@ -131,6 +278,18 @@ def get_count(table, engine, filter=None):
     return execute_query(engine, query)[0][col_name]
 
 
+def get_count_estimate(table_oid, engine):
+    """
+    Returns the planner's estimate of the number of rows of the table, which PostgreSQL keeps
+    up to date on VACUUM and ANALYZE, or None if the table hasn't been analyzed yet.
+    """
+    pg_class = sa_table("pg_class", sa_column("oid"), sa_column("reltuples"))
+    query = select(cast(pg_class.c.reltuples, BigInteger)).where(pg_class.c.oid == table_oid)
+    estimate = execute_query(engine, query)[0][0]
+    # A table that was never analyzed has a reltuples value of 0 (or -1 since PostgreSQL 14).
+    return estimate if estimate > 0 else None
+
+
 def get_column_cast_records(engine, table, column_definitions, num_records=20):
     assert len(column_definitions) == len(table.columns)
     cast_expression_list = [
@@ -1,6 +1,8 @@
 import pytest
 from db.functions.exceptions import UnknownDBFunctionID, BadDBFunctionFormat
-from db.functions.operations.deserialize import get_db_function_from_ma_function_spec
+from db.functions.operations.deserialize import (
+    get_cached_db_function_from_ma_function_spec, get_db_function_from_ma_function_spec
+)
 
 
 exceptions_test_list = [
@@ -24,3 +26,16 @@ exceptions_test_list = [
 def test_get_records_filters_exceptions(filter, exception):
     with pytest.raises(exception):
         get_db_function_from_ma_function_spec(filter)
+
+
+def test_get_cached_db_function_reuses_db_function():
+    spec = {"equal": [{"column_name": ["varchar"]}, {"literal": ["test"]}]}
+    db_function = get_cached_db_function_from_ma_function_spec(spec)
+    assert db_function == get_db_function_from_ma_function_spec(spec)
+    assert get_cached_db_function_from_ma_function_spec(dict(spec)) is db_function
+
+
+@pytest.mark.parametrize("filter,exception", exceptions_test_list)
+def test_get_cached_db_function_exceptions(filter, exception):
+    with pytest.raises(exception):
+        get_cached_db_function_from_ma_function_spec(filter)
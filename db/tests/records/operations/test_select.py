@@ -1,11 +1,17 @@
 from decimal import Decimal
 from collections import Counter
 
+import pytest
 from sqlalchemy import Column
 from sqlalchemy import String
+from sqlalchemy import text
+from sqlalchemy import update
 
-from db.records.operations.select import get_records, get_column_cast_records
+from db.records.operations.select import (
+    get_records, get_column_cast_records, get_count, get_count_estimate, get_cursor_values
+)
 from db.tables.operations.create import create_mathesar_table
+from db.tables.operations.select import get_oid_from_table
 from db.tests.types import fixtures
 
 
@@ -33,6 +39,69 @@ def test_get_records_gets_limited_offset_records(roster_table_obj):
     assert len(offset_records) == 10 and offset_records[0] == base_records[5]
 
 
+def test_get_records_gets_filtered_offset_records(roster_table_obj):
+    roster, engine = roster_table_obj
+    filter = {"equal": [{"column_name": ["Subject"]}, {"literal": ["Math"]}]}
+    base_records = get_records(roster, engine, limit=10, filter=filter)
+    offset_records = get_records(roster, engine, limit=5, offset=5, filter=filter)
+    assert offset_records == base_records[5:]
+
+
+def test_get_records_gets_records_after_cursor(roster_table_obj):
+    roster, engine = roster_table_obj
+    base_records = get_records(roster, engine, limit=20)
+    cursor_values = get_cursor_values(roster, base_records[9])
+    after_records = get_records(roster, engine, limit=10, after=cursor_values)
+    assert cursor_values == [base_records[9]["id"]]
+    assert after_records == base_records[10:]
+
+
+def test_get_records_gets_records_after_cursor_mixed_directions(roster_table_obj):
+    roster, engine = roster_table_obj
+    order_by = [
+        {"field": "Grade", "direction": "desc"},
+        {"field": "Student Name", "direction": "asc"},
+    ]
+    base_records = get_records(roster, engine, limit=20, order_by=order_by)
+    cursor_values = get_cursor_values(roster, base_records[9], order_by)
+    after_records = get_records(
+        roster, engine, limit=10, order_by=order_by, after=cursor_values
+    )
+    assert after_records == base_records[10:]
+
+
+@pytest.mark.parametrize("order_by", [
+    [{"field": "Grade", "direction": "asc"}],
+    [{"field": "Grade", "direction": "desc"}],
+    [{"field": "Grade", "direction": "desc"}, {"field": "id", "direction": "desc"}],
+    [{"field": "Grade", "direction": "asc", "nullsfirst": True}],
+    [{"field": "Grade", "direction": "desc", "nullslast": True}],
+    [{"field": "Grade", "direction": "asc", "nullsfirst": True}, {"field": "id", "direction": "desc"}],
+])
+def test_get_records_pages_with_cursor_over_null_values(roster_table_obj, order_by):
+    roster, engine = roster_table_obj
+    with engine.begin() as conn:
+        conn.execute(update(roster).where(roster.c.id % 5 == 0).values(Grade=None))
+    base_records = get_records(roster, engine, order_by=order_by)
+
+    paged_records = get_records(roster, engine, limit=75, order_by=order_by)
+    while len(paged_records) < len(base_records):
+        cursor_values = get_cursor_values(roster, paged_records[-1], order_by)
+        page = get_records(roster, engine, limit=75, order_by=order_by, after=cursor_values)
+        assert page
+        paged_records += page
+
+    assert paged_records == base_records
+    assert any(record["Grade"] is None for record in paged_records)
+
+
+def test_get_records_streams_records(roster_table_obj):
+    roster, engine = roster_table_obj
+    record_iterator = get_records(roster, engine, limit=150, stream=True)
+    assert not isinstance(record_iterator, list)
+    assert list(record_iterator) == get_records(roster, engine, limit=150)
+
+
 def test_get_column_cast_records(engine_email_type):
     COL1 = "col1"
     COL2 = "col2"
@@ -110,3 +179,27 @@ def test_get_records_duplicate_only(roster_table_obj):
     all_counter = {k: v for k, v in all_counter.items() if v > 1}
     got_counter = Counter(tuple(r[c] for c in duplicate_only) for r in dupe_record_list)
     assert all_counter == got_counter
+
+
+def test_get_count_estimate(roster_table_obj):
+    roster, engine = roster_table_obj
+    with engine.begin() as conn:
+        conn.execute(text(f'ANALYZE "{roster.schema}"."{roster.name}"'))
+    roster_oid = get_oid_from_table(roster.name, roster.schema, engine)
+    # ANALYZE reads every row of a table this small, so the estimate is exact.
+    assert get_count_estimate(roster_oid, engine) == get_count(roster, engine) == 1000
+
+
+def test_get_count_estimate_never_analyzed(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "never_analyzed"
+    table = create_mathesar_table(table_name, schema, [Column("name", String)], engine)
+    with engine.begin() as conn:
+        # Keep autovacuum from analyzing the table while the test runs.
+        conn.execute(text(f'ALTER TABLE "{schema}"."{table_name}" SET (autovacuum_enabled = false)'))
+        conn.execute(table.insert().values([{"name": "one"}, {"name": "two"}, {"name": "three"}]))
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    # PostgreSQL reports 0 or -1 rows for a table that was never analyzed, which shouldn't be
+    # taken for an empty table, so there's no estimate and the records have to be counted.
+    assert get_count_estimate(table_oid, engine) is None
+    assert get_count(table, engine) == 3
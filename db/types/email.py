@@ -14,6 +14,7 @@ EMAIL_DOMAIN_NAME = EMAIL + "_domain_name"
 EMAIL_LOCAL_PART = EMAIL + "_local_part"
 
 DB_TYPE = base.get_qualified_name(EMAIL)
+DB_TYPE_UPPER = DB_TYPE.upper()
 QUALIFIED_EMAIL_DOMAIN_NAME = base.get_qualified_name(EMAIL_DOMAIN_NAME)
 QUALIFIED_EMAIL_LOCAL_PART = base.get_qualified_name(EMAIL_LOCAL_PART)
 
@@ -30,7 +31,7 @@ class Email(UserDefinedType):
     def get_col_spec(self, **_):
         # This results in the type name being upper case when viewed.
         # Actual usage in the DB is case-insensitive.
-        return DB_TYPE.upper()
+        return DB_TYPE_UPPER
 
 
 # This will register our custom email_domain_name function with sqlalchemy so
@@ -39,6 +40,8 @@ class email_domain_name(GenericFunction):
     type = Text
     name = quoted_name(QUALIFIED_EMAIL_DOMAIN_NAME, False)
     identifier = EMAIL_DOMAIN_NAME
+    # Lets SQLAlchemy cache the compiled form of statements using this function.
+    inherit_cache = True
 
 
 # This will register our custom email_local_part function with sqlalchemy so
@@ -47,6 +50,8 @@ class email_local_part(GenericFunction):
     type = Text
     name = quoted_name(QUALIFIED_EMAIL_LOCAL_PART, False)
     identifier = EMAIL_LOCAL_PART
+    # Lets SQLAlchemy cache the compiled form of statements using this function.
+    inherit_cache = True
 
 
 def install(engine):
@@ -5,23 +5,21 @@ from db.types import base
 
 MATHESAR_MONEY = base.MathesarCustomType.MATHESAR_MONEY.value
 DB_TYPE = base.get_qualified_name(MATHESAR_MONEY)
+DB_TYPE_UPPER = DB_TYPE.upper()
 
 
 class MathesarMoney(UserDefinedType):
 
     def get_col_spec(self, **_):
-        return DB_TYPE.upper()
+        return DB_TYPE_UPPER
 
 
 def install(engine):
-    drop_domain_query = f"""
+    # Both statements are sent in a single execute to save a round trip.
+    drop_and_create_domain_query = f"""
     DROP DOMAIN IF EXISTS {DB_TYPE};
-    """
-    create_domain_query = f"""
     CREATE DOMAIN {DB_TYPE} AS NUMERIC;
     """
 
     with engine.begin() as conn:
-        conn.execute(text(drop_domain_query))
-        conn.execute(text(create_domain_query))
-        conn.commit()
+        conn.execute(text(drop_and_create_domain_query))
@@ -7,6 +7,7 @@ from db.types import base
 MULTICURRENCY_MONEY = base.MathesarCustomType.MULTICURRENCY_MONEY.value
 
 DB_TYPE = base.get_qualified_name(MULTICURRENCY_MONEY)
+DB_TYPE_UPPER = DB_TYPE.upper()
 VALUE = 'value'
 CURRENCY = 'currency'
 
@@ -14,7 +15,7 @@ CURRENCY = 'currency'
 class MulticurrencyMoney(UserDefinedType):
 
     def get_col_spec(self, **_):
-        return DB_TYPE.upper()
+        return DB_TYPE_UPPER
 
     def bind_processor(self, _):
         return lambda x: Json(x)
@@ -27,16 +28,11 @@ class MulticurrencyMoney(UserDefinedType):
 
 
 def install(engine):
-
-    drop_type_query = f"""
+    # Both statements are sent in a single execute to save a round trip.
+    drop_and_create_type_query = f"""
     DROP TYPE IF EXISTS {DB_TYPE};
-    """
-
-    create_type_query = f"""
     CREATE TYPE {DB_TYPE} AS ({VALUE} NUMERIC, {CURRENCY} CHAR(3));
     """
 
     with engine.begin() as conn:
-        conn.execute(text(drop_type_query))
-        conn.execute(text(create_type_query))
-        conn.commit()
+        conn.execute(text(drop_and_create_type_query))
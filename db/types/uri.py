@@ -13,6 +13,7 @@ from db.types import base
 
 URI_STR = base.MathesarCustomType.URI.value
 DB_TYPE = base.get_qualified_name(URI_STR)
+DB_TYPE_UPPER = DB_TYPE.upper()
 
 TLDS_PATH = os.path.join(
     os.path.join(os.path.abspath(os.path.dirname(__file__)), "resources"),
@@ -49,7 +50,7 @@ class URI(UserDefinedType):
     def get_col_spec(self, **_):
         # This results in the type name being upper case when viewed.
         # Actual usage in the DB is case-insensitive.
-        return DB_TYPE.upper()
+        return DB_TYPE_UPPER
 
 
 # This function lets us avoid having to define repetitive classes for
@@ -58,7 +59,9 @@ def build_generic_function_def_class(name):
     class_dict = {
         "type": Text,
         "name": quoted_name(QualifiedURIFunction[name].value, False),
-        "identifier": URIFunction[name].value
+        "identifier": URIFunction[name].value,
+        # Lets SQLAlchemy cache the compiled form of statements using these functions.
+        "inherit_cache": True,
     }
     return type(class_dict["identifier"], (GenericFunction,), class_dict)
 
@@ -1,3 +1,7 @@
+# Number of rows fetched from a server side cursor at a time when streaming results.
+STREAM_BATCH_SIZE = 100
+
+
 def execute_statement(engine, statement, connection_to_use=None):
     if connection_to_use:
         return connection_to_use.execute(statement)
@@ -8,3 +12,16 @@ def execute_statement(engine, statement, connection_to_use=None):
 
 def execute_query(engine, query, connection_to_use=None):
     return execute_statement(engine, query, connection_to_use=None).fetchall()
+
+
+def iter_query_results(engine, query, batch_size=STREAM_BATCH_SIZE):
+    """
+    Yields the rows of the query as they're fetched from a server side cursor, `batch_size` rows
+    at a time, instead of loading the whole result into memory. The connection is held until
+    the iterator is exhausted or closed.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, max_row_buffer=batch_size
+        ).execute(query)
+        yield from result
@@ -41,3 +41,15 @@ class DatabaseViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMixi
         available_known_db_types = get_available_known_db_types(engine)
         serializer = DBTypeSerializer(available_known_db_types, many=True)
         return Response(serializer.data)
+
+    @action(methods=['get'], detail=True)
+    def pool_status(self, request, pk=None):
+        database = self.get_object()
+        pool = database._sa_engine.pool
+        return Response({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+            'status': pool.status(),
+        })
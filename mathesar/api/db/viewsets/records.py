@@ -6,14 +6,42 @@ from sqlalchemy_filters.exceptions import BadSortFormat, SortFieldNotFound
 
 import mathesar.api.exceptions.database_exceptions.exceptions as database_api_exceptions
 from db.functions.exceptions import BadDBFunctionFormat, ReferencedColumnsDontExist, UnknownDBFunctionID
-from db.records.exceptions import BadGroupFormat, GroupFieldNotFound, InvalidGroupType
+from db.records.exceptions import BadCursorFormat, BadGroupFormat, GroupFieldNotFound, InvalidGroupType
 from mathesar.api.pagination import TableLimitOffsetGroupPagination
-from mathesar.api.serializers.records import RecordListParameterSerializer, RecordSerializer
+from mathesar.api.serializers.records import RecordSerializer, parse_record_list_parameters
 from mathesar.api.utils import get_table_or_404
 from mathesar.functions.operations.convert import rewrite_db_function_spec_column_ids_to_names
 from mathesar.models import Table
 from mathesar.utils.json import MathesarJSONRenderer
 
+# Errors in the list parameters, keyed by their exact type, mapped to the parameter they're
+# reported for and the API exception they're reported as.
+_EXCEPTION_MAP = {
+    BadDBFunctionFormat: ('filters', database_api_exceptions.BadFilterAPIException),
+    UnknownDBFunctionID: ('filters', database_api_exceptions.BadFilterAPIException),
+    ReferencedColumnsDontExist: ('filters', database_api_exceptions.BadFilterAPIException),
+    BadSortFormat: ('order_by', database_api_exceptions.BadSortAPIException),
+    SortFieldNotFound: ('order_by', database_api_exceptions.BadSortAPIException),
+    BadGroupFormat: ('grouping', database_api_exceptions.BadGroupAPIException),
+    GroupFieldNotFound: ('grouping', database_api_exceptions.BadGroupAPIException),
+    InvalidGroupType: ('grouping', database_api_exceptions.BadGroupAPIException),
+    BadCursorFormat: ('cursor', database_api_exceptions.BadCursorAPIException),
+}
+
+
+def _spec_has_column_ids(spec):
+    """
+    Cheap check for whether a DB function spec references any column by id, so that specs made
+    only of column names and literals can skip the id to name rewrite.
+    """
+    if isinstance(spec, dict):
+        return any(
+            key == 'column_id' or _spec_has_column_ids(value) for key, value in spec.items()
+        )
+    elif isinstance(spec, list):
+        return any(_spec_has_column_ids(item) for item in spec)
+    return False
+
 
 class RecordViewSet(viewsets.ViewSet):
     # There is no 'update' method.
@@ -28,20 +56,29 @@ class RecordViewSet(viewsets.ViewSet):
     # db/functions/operations/deserialize.py::get_db_function_from_ma_function_spec function doc>
     # For sorting parameter formatting, see:
     # https://github.com/centerofci/sqlalchemy-filters#sort-format
+    # For keyset pagination, pass the `next_cursor` of the previous page as the `cursor`
+    # parameter instead of an offset. The cursor is only valid with the same ordering, and
+    # sending both a cursor and an offset is an error.
+    # Pass `stream=true` to have the records encoded while the response is sent, instead of
+    # building the whole body in memory first. A streamed response holds a database connection
+    # until the client has read all of it. Pass `count_only=true` to only get the count, and
+    # `exact_count=false` to accept an estimated count for unfiltered tables.
     def list(self, request, table_pk=None):
         paginator = TableLimitOffsetGroupPagination()
 
-        serializer = RecordListParameterSerializer(data=request.GET)
-        serializer.is_valid(raise_exception=True)
+        list_params = parse_record_list_parameters(request.GET)
         table = get_table_or_404(table_pk)
 
-        filter_unprocessed = serializer.validated_data['filter']
-        order_by = serializer.validated_data['order_by']
-        grouping = serializer.validated_data['grouping']
+        filter_unprocessed = list_params.filter
+        order_by = list_params.order_by
+        grouping = list_params.grouping
+        stream = list_params.stream
         filter_processed = None
-        column_ids_to_names = table.get_column_name_id_bidirectional_map().inverse
-        if filter_unprocessed:
-            table = get_table_or_404(table_pk)
+        columns_map = table.get_column_name_id_bidirectional_map()
+        column_ids_to_names = columns_map.inverse
+        if filter_unprocessed and not _spec_has_column_ids(filter_unprocessed):
+            filter_processed = filter_unprocessed
+        elif filter_unprocessed:
             filter_processed = rewrite_db_function_spec_column_ids_to_names(
                 column_ids_to_names=column_ids_to_names,
                 spec=filter_unprocessed,
@@ -60,31 +97,28 @@ class RecordViewSet(viewsets.ViewSet):
                 filters=filter_processed,
                 order_by=name_converted_order_by,
                 grouping=name_converted_group_by,
-                duplicate_only=serializer.validated_data['duplicate_only'],
-            )
-        except (BadDBFunctionFormat, UnknownDBFunctionID, ReferencedColumnsDontExist) as e:
-            raise database_api_exceptions.BadFilterAPIException(
-                e,
-                field='filters',
-                status_code=status.HTTP_400_BAD_REQUEST
-            )
-        except (BadSortFormat, SortFieldNotFound) as e:
-            raise database_api_exceptions.BadSortAPIException(
-                e,
-                field='order_by',
-                status_code=status.HTTP_400_BAD_REQUEST
-            )
-        except (BadGroupFormat, GroupFieldNotFound, InvalidGroupType) as e:
-            raise database_api_exceptions.BadGroupAPIException(
-                e,
-                field='grouping',
-                status_code=status.HTTP_400_BAD_REQUEST
+                duplicate_only=list_params.duplicate_only,
+                stream=stream,
+                count_only=list_params.count_only,
+                exact_count=list_params.exact_count,
             )
+        except Exception as e:
+            api_exception_spec = _EXCEPTION_MAP.get(type(e))
+            if api_exception_spec is None:
+                raise
+            field, api_exception_class = api_exception_spec
+            raise api_exception_class(e, field=field, status_code=status.HTTP_400_BAD_REQUEST)
+        if list_params.count_only:
+            return Response({'count': paginator.count, 'is_estimate': paginator.is_estimate})
         serializer = RecordSerializer(
             records,
             many=True,
-            context=self.get_serializer_context(table)
+            context={'columns_map': columns_map, 'table': table}
         )
+        if stream:
+            return paginator.get_streaming_paginated_response(
+                serializer.iter_representation(records or [])
+            )
         return paginator.get_paginated_response(serializer.data)
 
     def retrieve(self, request, pk=None, table_pk=None):
@@ -175,6 +175,20 @@ class BadGroupAPIException(MathesarAPIException):
         super().__init__(exception, self.error_code, message, field, details, status_code)
 
 
+class BadCursorAPIException(MathesarAPIException):
+    error_code = ErrorCodes.UnsupportedType.value
+
+    def __init__(
+            self,
+            exception,
+            message="Cursor is not valid for this table and ordering",
+            field=None,
+            details=None,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+    ):
+        super().__init__(exception, self.error_code, message, field, details, status_code)
+
+
 class RaiseExceptionAPIException(MathesarAPIException):
     """
     Exception raised inside a postgres function
@@ -1,10 +1,142 @@
+import base64
+import binascii
+import datetime
+import hashlib
+import itertools
+import json
+import logging
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 
+from db.records.exceptions import BadCursorFormat
 from db.records.operations.group import GroupBy
+from db.records.operations.select import get_cursor_values
 from mathesar.api.utils import get_table_or_404, process_annotated_records
+from mathesar.utils.json import dumps
+
+
+logger = logging.getLogger(__name__)
+
+_NO_RECORD = object()
+
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Sort key values JSON can't represent are sent tagged with their type, so they're decoded back
+# to the same Python value. Types which PostgreSQL can't be relied on to cast back from a string
+# (e.g. bytes, intervals) need this, and it keeps the others exact.
+_CURSOR_VALUE_CODECS = {
+    # psycopg2 returns bytea values as memoryviews.
+    'bytes': (
+        (bytes, memoryview),
+        lambda value: base64.b64encode(bytes(value)).decode(),
+        base64.b64decode,
+    ),
+    'decimal': (Decimal, str, Decimal),
+    'datetime': (datetime.datetime, datetime.datetime.isoformat, datetime.datetime.fromisoformat),
+    'date': (datetime.date, datetime.date.isoformat, datetime.date.fromisoformat),
+    'time': (datetime.time, datetime.time.isoformat, datetime.time.fromisoformat),
+    'timedelta': (
+        datetime.timedelta,
+        lambda value: [value.days, value.seconds, value.microseconds],
+        lambda value: datetime.timedelta(*value),
+    ),
+}
+
+
+def _get_order_by_fingerprint(order_by):
+    order_by_fields = [
+        [
+            str(sort['field']),
+            sort.get('direction', 'asc'),
+            bool(sort.get('nullsfirst')),
+            bool(sort.get('nullslast')),
+        ]
+        for sort in order_by
+    ]
+    order_by_json = json.dumps(order_by_fields)
+    return hashlib.sha1(order_by_json.encode()).hexdigest()[:16]
+
+
+def _encode_cursor_value(value):
+    if isinstance(value, _JSON_SCALAR_TYPES):
+        return value
+    # datetime is a subclass of date, so its codec comes first.
+    for type_name, (value_type, encode, _) in _CURSOR_VALUE_CODECS.items():
+        if isinstance(value, value_type):
+            return {'type': type_name, 'value': encode(value)}
+    raise TypeError(f"Values of type {type(value).__name__} can't be used in a cursor.")
+
+
+def _decode_cursor_value(value):
+    if isinstance(value, dict) and value.get('type') in _CURSOR_VALUE_CODECS:
+        _, _, decode = _CURSOR_VALUE_CODECS[value['type']]
+        return decode(value.get('value'))
+    if not isinstance(value, _JSON_SCALAR_TYPES):
+        raise ValueError(f"{value} is not a valid cursor value.")
+    return value
+
+
+def encode_cursor(cursor_values, order_by):
+    """
+    Encodes the sort key values of a record, along with a fingerprint of the ordering they were
+    taken under. Returns None if a value is of a type cursors don't support, in which case
+    clients page with offsets instead.
+    """
+    try:
+        values = [_encode_cursor_value(value) for value in cursor_values]
+    except TypeError:
+        return None
+    cursor_json = json.dumps({'order_by': _get_order_by_fingerprint(order_by), 'values': values})
+    return base64.urlsafe_b64encode(cursor_json.encode()).decode()
+
+
+def decode_cursor(cursor, order_by):
+    try:
+        cursor_data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise BadCursorFormat(f"Cursor {cursor} could not be decoded.") from e
+    if not isinstance(cursor_data, dict) or not isinstance(cursor_data.get('values'), list):
+        raise BadCursorFormat(f"Cursor {cursor} does not contain a list of values.")
+    if cursor_data.get('order_by') != _get_order_by_fingerprint(order_by):
+        raise BadCursorFormat(f"Cursor {cursor} was not created with the requested ordering.")
+    try:
+        return [_decode_cursor_value(value) for value in cursor_data['values']]
+    except (ArithmeticError, binascii.Error, TypeError, ValueError) as e:
+        raise BadCursorFormat(f"Cursor {cursor} contains invalid values.") from e
+
+
+_count_executor = ThreadPoolExecutor(
+    max_workers=settings.MATHESAR_DB_COUNT_THREADS, thread_name_prefix='mathesar_count'
+)
+_idle_count_threads = threading.BoundedSemaphore(settings.MATHESAR_DB_COUNT_THREADS)
+
+
+def _submit_count(count_function, *args, **kwargs):
+    """
+    Runs count_function on one of the shared count threads and returns its future, or returns
+    None without running it when every count thread is busy.
+    """
+    if not _idle_count_threads.acquire(blocking=False):
+        return None
+    future = _count_executor.submit(count_function, *args, **kwargs)
+    future.add_done_callback(lambda _: _idle_count_threads.release())
+    return future
+
+
+def _resolve_sa_objects(table):
+    """
+    Resolves the SQLAlchemy table and engine of the table, which are cached on the model, so
+    that a thread using the model afterwards doesn't need the Django ORM, or race us to reflect
+    the table.
+    """
+    return table._sa_table, table.schema._sa_engine
 
 
 class DefaultLimitOffsetPagination(LimitOffsetPagination):
@@ -30,12 +162,101 @@ class ColumnLimitOffsetPagination(DefaultLimitOffsetPagination):
             self.limit = self.default_limit
         self.offset = self.get_offset(request)
         table = get_table_or_404(pk=table_id)
-        self.count = len(table.sa_columns)
+        columns = list(table.sa_columns)
+        self.count = len(columns)
         self.request = request
-        return list(table.sa_columns)[self.offset:self.offset + self.limit]
+        return columns[self.offset:self.offset + self.limit]
 
 
 class TableLimitOffsetPagination(DefaultLimitOffsetPagination):
+    cursor_query_param = 'cursor'
+
+    def get_page_metadata(self):
+        return OrderedDict(
+            [
+                ('count', self.count),
+                ('is_estimate', self.is_estimate),
+                ('next_cursor', self.next_cursor),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([*self.get_page_metadata().items(), ('results', data)]))
+
+    def get_streaming_paginated_response(self, data):
+        """
+        Same body as get_paginated_response, but `data` can be an iterator and is encoded one
+        record at a time while the response is being sent, instead of all at once. The page
+        metadata is sent before the results, so clients can read it without waiting for the
+        whole page, except for the next cursor, which is only known once every record of a
+        streamed page has been read and so comes last.
+
+        The first record is fetched before the response is returned, so that errors running the
+        query are raised as usual, before the status is sent. An error fetching a later record
+        can only be reported in the body: the results are then followed by an `error` key and a
+        null next cursor. A streamed page holds its pooled database connection until the client
+        has read the whole response.
+        """
+        records = iter(data)
+        first_record = next(records, _NO_RECORD)
+        if first_record is not _NO_RECORD:
+            records = itertools.chain([first_record], records)
+
+        def _iter_json_chunks():
+            yield b'{'
+            for key, value in self.get_page_metadata().items():
+                if key != 'next_cursor':
+                    yield dumps(key) + b':' + dumps(value) + b','
+            yield b'"results":['
+            try:
+                for i, record in enumerate(records):
+                    yield (b',' if i else b'') + dumps(record)
+            except Exception:
+                logger.exception("Fetching streamed records failed.")
+                yield b'],"next_cursor":null,"error":' + dumps("Fetching the records failed.") + b'}'
+                return
+            yield b'],"next_cursor":' + dumps(self.next_cursor) + b'}'
+
+        return StreamingHttpResponse(_iter_json_chunks(), content_type='application/json')
+
+    def get_next_cursor(self, table, last_record, num_records, order_by):
+        # A short page means there are no more records to fetch.
+        if last_record is None or num_records < self.limit:
+            return None
+        cursor_values = get_cursor_values(table._sa_table, last_record, order_by)
+        return encode_cursor(cursor_values, order_by) if cursor_values is not None else None
+
+    def get_count_without_counting(self, table, filters, duplicate_only, exact_count):
+        """
+        Returns what get_count would, when that doesn't need counting the records, i.e. when
+        the estimate is used or the count is cached. Returns None otherwise.
+        """
+        if not exact_count and filters is None and not duplicate_only:
+            estimated_count = table.sa_estimated_num_records()
+            if estimated_count is not None:
+                return estimated_count, True
+        cached_count = table.get_num_records_from_cache(filter=filters)
+        if cached_count is not None:
+            return cached_count, False
+        return None
+
+    def get_count(self, table, filters, duplicate_only, exact_count):
+        """
+        Returns the number of records and whether it's an estimate. Without `exact_count`, the
+        planner's estimate is used for unfiltered tables when there is one, since counting every
+        row of a big table is slow.
+        """
+        count = self.get_count_without_counting(table, filters, duplicate_only, exact_count)
+        if count is None:
+            count = table.get_cached_num_records(filter=filters), False
+        return count
+
+    def _iter_page_records(self, table, records, order_by):
+        last_record, num_records = None, 0
+        for num_records, record in enumerate(records, 1):
+            last_record = record
+            yield record
+        self.next_cursor = self.get_next_cursor(table, last_record, num_records, order_by)
 
     def paginate_queryset(
         self,
@@ -46,36 +267,90 @@ class TableLimitOffsetPagination(DefaultLimitOffsetPagination):
         order_by=[],
         group_by=None,
         duplicate_only=None,
+        stream=False,
+        count_only=False,
+        exact_count=True,
     ):
+        """
+        With `stream`, the records are returned as an iterator fetching them from the database
+        as it's consumed, and the next cursor is set once it's exhausted. With `count_only`, only
+        the count is set and no records are fetched. See get_count for `exact_count`.
+        """
         self.limit = self.get_limit(request)
         if self.limit is None:
             self.limit = self.default_limit
         self.offset = self.get_offset(request)
-        # TODO: Cache count value somewhere, since calculating it is expensive.
-        self.count = table.sa_num_records(filter=filters)
         self.request = request
+        if count_only:
+            self.count, self.is_estimate = self.get_count(table, filters, duplicate_only, exact_count)
+            self.next_cursor = None
+            return []
 
-        return table.get_records(
-            self.limit,
-            self.offset,
-            filter=filters,
-            order_by=order_by,
-            group_by=group_by,
-            duplicate_only=duplicate_only,
-        )
+        # When the client sends the cursor returned with the previous page, we fetch the records
+        # following it instead of skipping `offset` records, which gets slower the further along
+        # the table the page is. It's decoded before anything is counted, so a bad cursor is
+        # rejected without querying the database.
+        cursor = request.query_params.get(self.cursor_query_param)
+        after = None
+        if cursor:
+            if self.offset_query_param in request.query_params:
+                raise BadCursorFormat("A cursor can't be sent along with an offset.")
+            after = decode_cursor(cursor, order_by)
+
+        count = self.get_count_without_counting(table, filters, duplicate_only, exact_count)
+        count_future = None
+        if count is None:
+            # Counting can take as long as fetching the page, so when there's a count thread
+            # available, the records are counted there, on its own connection, while they're
+            # fetched here.
+            _resolve_sa_objects(table)
+            count_future = _submit_count(table.get_cached_num_records, filter=filters)
+        try:
+            if after is not None:
+                records = table.get_records_after(
+                    after,
+                    self.limit,
+                    filter=filters,
+                    order_by=order_by,
+                    group_by=group_by,
+                    duplicate_only=duplicate_only,
+                    stream=stream,
+                )
+            else:
+                records = table.get_records(
+                    self.limit,
+                    self.offset,
+                    filter=filters,
+                    order_by=order_by,
+                    group_by=group_by,
+                    duplicate_only=duplicate_only,
+                    stream=stream,
+                )
+        except Exception:
+            # Don't leave the count running unnoticed. When it has already started, it can't be
+            # stopped, so wait for it to give its connection back before reporting the error.
+            if count_future is not None and not count_future.cancel():
+                count_future.exception()
+            raise
+        if count is None:
+            if count_future is not None:
+                count = count_future.result(), False
+            else:
+                count = table.get_cached_num_records(filter=filters), False
+        self.count, self.is_estimate = count
+        if stream:
+            self.next_cursor = None
+            return self._iter_page_records(table, records, order_by)
+        last_record = records[-1] if records else None
+        self.next_cursor = self.get_next_cursor(table, last_record, len(records), order_by)
+        return records
 
 
 class TableLimitOffsetGroupPagination(TableLimitOffsetPagination):
-    def get_paginated_response(self, data):
-        return Response(
-            OrderedDict(
-                [
-                    ('count', self.count),
-                    ('grouping', self.grouping),
-                    ('results', data)
-                ]
-            )
-        )
+    def get_page_metadata(self):
+        page_metadata = super().get_page_metadata()
+        page_metadata['grouping'] = self.grouping
+        return page_metadata
 
     def paginate_queryset(
         self,
@@ -86,8 +361,13 @@ class TableLimitOffsetGroupPagination(TableLimitOffsetPagination):
         order_by=[],
         grouping={},
         duplicate_only=None,
+        stream=False,
+        count_only=False,
+        exact_count=True,
     ):
         group_by = GroupBy(**grouping) if grouping else None
+        # Groups are collected from the whole page, so grouped records can't be streamed.
+        stream = stream and group_by is None
         records = super().paginate_queryset(
             queryset,
             request,
@@ -96,7 +376,13 @@ class TableLimitOffsetGroupPagination(TableLimitOffsetPagination):
             order_by=order_by,
             group_by=group_by,
             duplicate_only=duplicate_only,
+            stream=stream,
+            count_only=count_only,
+            exact_count=exact_count,
         )
+        if stream:
+            self.grouping = None
+            return records
 
         if records:
             processed_records, groups = process_annotated_records(records)
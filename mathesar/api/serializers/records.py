@@ -1,6 +1,10 @@
+from collections import namedtuple
+
+import orjson
 from psycopg2.errors import NotNullViolation
 from rest_framework import serializers
 from rest_framework import status
+from rest_framework.utils import json as drf_json
 from sqlalchemy.exc import IntegrityError
 
 import mathesar.api.exceptions.database_exceptions.exceptions as database_api_exceptions
@@ -12,9 +16,88 @@ class RecordListParameterSerializer(MathesarErrorMessageMixin, serializers.Seria
     order_by = serializers.JSONField(required=False, default=[])
     grouping = serializers.JSONField(required=False, default={})
     duplicate_only = serializers.JSONField(required=False, default=None)
+    stream = serializers.BooleanField(required=False, default=False)
+    count_only = serializers.BooleanField(required=False, default=False)
+    exact_count = serializers.BooleanField(required=False, default=True)
+
+
+RecordListParameters = namedtuple(
+    'RecordListParameters',
+    ['filter', 'order_by', 'grouping', 'duplicate_only', 'stream', 'count_only', 'exact_count'],
+)
+
+
+def parse_record_list_parameters(query_params):
+    """
+    Parses the records list query parameters like RecordListParameterSerializer, without going
+    through the serializer field machinery on every request. Invalid parameters are handed to
+    the serializer, so that they're reported the same way.
+    """
+    try:
+        json_params = {
+            name: _parse_json_parameter(query_params[name]) if name in query_params else default
+            for name, default in (
+                ('filter', None), ('order_by', []), ('grouping', {}), ('duplicate_only', None)
+            )
+        }
+        boolean_params = {
+            name: _parse_boolean_parameter(query_params.get(name), default)
+            for name, default in (('stream', False), ('count_only', False), ('exact_count', True))
+        }
+    except ValueError:
+        serializer = RecordListParameterSerializer(data=query_params)
+        serializer.is_valid(raise_exception=True)
+        return RecordListParameters(**serializer.validated_data)
+    return RecordListParameters(**json_params, **boolean_params)
+
+
+def _contains_float(value):
+    if isinstance(value, float):
+        return True
+    elif isinstance(value, dict):
+        return any(_contains_float(item) for item in value.values())
+    elif isinstance(value, list):
+        return any(_contains_float(item) for item in value)
+    return False
+
+
+def _parse_json_parameter(value):
+    parsed = orjson.loads(value)
+    # orjson turns integers that don't fit in 64 bits into floats, so anything with a float in it
+    # is parsed again the way the serializer's JSONField does, which keeps them exact.
+    if _contains_float(parsed):
+        return drf_json.loads(value)
+    return parsed
+
+
+def _parse_boolean_parameter(value, default):
+    if value is None:
+        return default
+    elif value in serializers.BooleanField.TRUE_VALUES:
+        return True
+    elif value in serializers.BooleanField.FALSE_VALUES:
+        return False
+    raise ValueError(f'{value} is not a valid boolean.')
+
+
+class RecordListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        return list(self.iter_representation(data))
+
+    def iter_representation(self, data):
+        # Records only need their keys translated from column names to ids, so build a plain dict
+        # lookup once and skip the per record child serializer dispatch. Values are left as they
+        # come from the database for the renderer to encode.
+        columns_map = dict(self.context['columns_map'])
+        for record in data:
+            record = record if isinstance(record, dict) else record._asdict()
+            yield {columns_map[column_name]: column_value for column_name, column_value in record.items()}
 
 
 class RecordSerializer(MathesarErrorMessageMixin, serializers.BaseSerializer):
+    class Meta:
+        list_serializer_class = RecordListSerializer
+
     def update(self, instance, validated_data):
         table = self.context['table']
         record = table.update_record(instance['id'], validated_data)
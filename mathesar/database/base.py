@@ -4,10 +4,18 @@ from db import engine
 
 
 def create_mathesar_engine(database):
+    """
+    Creates a new engine, with its own connection pool, for the given database. Use the engine
+    cached by the Database model instead, unless the pool is disposed of after use.
+    """
     return engine.create_future_engine_with_custom_types(
         settings.DATABASES[database]["USER"],
         settings.DATABASES[database]["PASSWORD"],
         settings.DATABASES[database]["HOST"],
         settings.DATABASES[database]["NAME"],
         settings.DATABASES[database]["PORT"],
+        pool_size=settings.MATHESAR_DB_POOL_SIZE,
+        max_overflow=settings.MATHESAR_DB_MAX_OVERFLOW,
+        pool_pre_ping=settings.MATHESAR_DB_POOL_PRE_PING,
+        pool_recycle=settings.MATHESAR_DB_POOL_RECYCLE,
     )
@@ -2,7 +2,6 @@ from io import TextIOWrapper
 
 import clevercsv as csv
 
-from mathesar.database.base import create_mathesar_engine
 from mathesar.models import Table
 from db.records.operations.insert import insert_records_from_csv
 from db.tables.operations.create import create_string_column_table
@@ -108,7 +107,7 @@ def get_sv_reader(file, header, dialect=None):
 
 
 def create_db_table_from_data_file(data_file, name, schema):
-    engine = create_mathesar_engine(schema.database.name)
+    engine = schema._sa_engine
     sv_filename = data_file.file.path
     header = data_file.header
     dialect = csv.dialect.SimpleDialect(data_file.delimiter, data_file.quotechar,
@@ -159,7 +158,7 @@ def create_db_table_from_data_file(data_file, name, schema):
 
 
 def create_table_from_csv(data_file, name, schema):
-    engine = create_mathesar_engine(schema.database.name)
+    engine = schema._sa_engine
     db_table = create_db_table_from_data_file(
         data_file, name, schema
     )
@@ -1,3 +1,8 @@
+import hashlib
+import json
+import threading
+from uuid import uuid4
+
 from bidict import bidict
 from django.contrib.auth.models import User
 from django.core.cache import cache
@@ -10,14 +15,16 @@ from db.columns import utils as column_utils
 from db.columns.operations.create import create_column, duplicate_column
 from db.columns.operations.alter import alter_column
 from db.columns.operations.drop import drop_column
-from db.columns.operations.select import get_column_name_from_attnum, get_columns_attnum_from_names
+from db.columns.operations.select import (
+    get_column_name_from_attnum, get_column_names_by_attnum, get_columns_attnum_from_names
+)
 from db.constraints.operations.create import create_unique_constraint
 from db.constraints.operations.drop import drop_constraint
 from db.constraints.operations.select import get_constraint_oid_by_name_and_table_oid, get_constraint_from_oid
 from db.constraints import utils as constraint_utils
 from db.records.operations.delete import delete_record
 from db.records.operations.insert import insert_record_or_records
-from db.records.operations.select import get_column_cast_records, get_count, get_record
+from db.records.operations.select import get_column_cast_records, get_count, get_count_estimate, get_record
 from db.records.operations.select import get_records as db_get_records
 from db.records.operations.update import update_record
 from db.schemas.operations.drop import drop_schema
@@ -32,6 +39,19 @@ from mathesar.database.types import get_types
 
 
 NAME_CACHE_INTERVAL = 60 * 5
+NUM_RECORDS_CACHE_INTERVAL = 60
+
+
+def _get_cache_version(version_key):
+    """
+    Cached values that need to be dropped together are keyed by a version, which gets replaced
+    by deleting the version key.
+    """
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid4().hex
+        cache.set(version_key, version, None)
+    return version
 
 
 class BaseModel(models.Model):
@@ -81,6 +101,20 @@ class DatabaseObject(ReflectionManagerMixin, BaseModel):
 # TODO: Replace with a proper form of caching
 # See: https://github.com/centerofci/mathesar/issues/280
 _engines = {}
+# Engines are also requested from the count threads, so creating them is serialized, to avoid
+# building two engines and pools for one database.
+_engines_lock = threading.Lock()
+
+
+def get_database_engine(database_name):
+    """
+    Returns the engine of the database, creating it the first time. Engines are kept for the
+    lifetime of the process, so that their connection pools are shared by every caller.
+    """
+    with _engines_lock:
+        if database_name not in _engines:
+            _engines[database_name] = create_mathesar_engine(database_name)
+        return _engines[database_name]
 
 
 class Database(ReflectionManagerMixin, BaseModel):
@@ -91,11 +125,7 @@ class Database(ReflectionManagerMixin, BaseModel):
 
     @property
     def _sa_engine(self):
-        global _engines
-        # We're caching this since the engine is used frequently.
-        if self.name not in _engines:
-            _engines[self.name] = create_mathesar_engine(self.name)
-        return _engines[self.name]
+        return get_database_engine(self.name)
 
     @property
     def supported_types(self):
@@ -232,19 +262,25 @@ class Table(DatabaseObject):
         return True
 
     def add_column(self, column_data):
-        return create_column(
+        column = create_column(
             self.schema._sa_engine,
             self.oid,
             column_data,
         )
+        self.clear_column_name_id_map_cache()
+        self.clear_num_records_cache()
+        return column
 
     def alter_column(self, column_attnum, column_data):
-        return alter_column(
+        column = alter_column(
             self.schema._sa_engine,
             self.oid,
             column_attnum,
             column_data,
         )
+        self.clear_column_name_id_map_cache()
+        self.clear_num_records_cache()
+        return column
 
     def drop_column(self, column_attnum):
         drop_column(
@@ -252,9 +288,11 @@ class Table(DatabaseObject):
             column_attnum,
             self.schema._sa_engine,
         )
+        self.clear_column_name_id_map_cache()
+        self.clear_num_records_cache()
 
     def duplicate_column(self, column_attnum, copy_data, copy_constraints, name=None):
-        return duplicate_column(
+        column = duplicate_column(
             self.oid,
             column_attnum,
             self.schema._sa_engine,
@@ -262,6 +300,9 @@ class Table(DatabaseObject):
             copy_data=copy_data,
             copy_constraints=copy_constraints,
         )
+        self.clear_column_name_id_map_cache()
+        self.clear_num_records_cache()
+        return column
 
     def get_preview(self, column_definitions):
         return get_column_cast_records(
@@ -275,8 +316,46 @@ class Table(DatabaseObject):
     def sa_num_records(self, filter=None):
         return get_count(self._sa_table, self.schema._sa_engine, filter=filter)
 
+    def sa_estimated_num_records(self):
+        return get_count_estimate(self.oid, self.schema._sa_engine)
+
+    @property
+    def _num_records_cache_version_key(self):
+        return f"table_num_records_version_{self.id}"
+
+    def _get_num_records_cache_key(self, filter):
+        # Counts are keyed by a version so that we can drop the counts for every filter at once.
+        version = _get_cache_version(self._num_records_cache_version_key)
+        filter_hash = hashlib.sha1(json.dumps(filter, sort_keys=True).encode()).hexdigest()
+        return f"table_num_records_{self.id}_{version}_{filter_hash}"
+
+    def get_cached_num_records(self, filter=None):
+        """
+        Same as sa_num_records, but the count is kept in the cache for a while, since counting
+        can cost more than fetching a page of records. Writes made through this model clear the
+        cached counts of the table.
+        """
+        return cache.get_or_set(
+            self._get_num_records_cache_key(filter),
+            lambda: self.sa_num_records(filter=filter),
+            NUM_RECORDS_CACHE_INTERVAL,
+        )
+
+    def get_num_records_from_cache(self, filter=None):
+        """
+        Returns the count get_cached_num_records would return if it's already cached, without
+        counting otherwise.
+        """
+        return cache.get(self._get_num_records_cache_key(filter))
+
+    def clear_num_records_cache(self):
+        cache.delete(self._num_records_cache_version_key)
+
     def update_sa_table(self, update_params):
-        return model_utils.update_sa_table(self, update_params)
+        result = model_utils.update_sa_table(self, update_params)
+        self.clear_column_name_id_map_cache()
+        self.clear_num_records_cache()
+        return result
 
     def delete_sa_table(self):
         return drop_table(self.name, self.schema.name, self.schema._sa_engine, cascade=True)
@@ -292,6 +371,7 @@ class Table(DatabaseObject):
         order_by=[],
         group_by=None,
         duplicate_only=None,
+        stream=False,
     ):
         return db_get_records(
             self._sa_table,
@@ -302,16 +382,45 @@ class Table(DatabaseObject):
             order_by=order_by,
             group_by=group_by,
             duplicate_only=duplicate_only,
+            stream=stream,
+        )
+
+    def get_records_after(
+        self,
+        after,
+        limit=None,
+        filter=None,
+        order_by=[],
+        group_by=None,
+        duplicate_only=None,
+        stream=False,
+    ):
+        return db_get_records(
+            self._sa_table,
+            self.schema._sa_engine,
+            limit,
+            filter=filter,
+            order_by=order_by,
+            group_by=group_by,
+            duplicate_only=duplicate_only,
+            stream=stream,
+            after=after,
         )
 
     def create_record_or_records(self, record_data):
-        return insert_record_or_records(self._sa_table, self.schema._sa_engine, record_data)
+        result = insert_record_or_records(self._sa_table, self.schema._sa_engine, record_data)
+        self.clear_num_records_cache()
+        return result
 
     def update_record(self, id_value, record_data):
-        return update_record(self._sa_table, self.schema._sa_engine, id_value, record_data)
+        result = update_record(self._sa_table, self.schema._sa_engine, id_value, record_data)
+        self.clear_num_records_cache()
+        return result
 
     def delete_record(self, id_value):
-        return delete_record(self._sa_table, self.schema._sa_engine, id_value)
+        result = delete_record(self._sa_table, self.schema._sa_engine, id_value)
+        self.clear_num_records_cache()
+        return result
 
     def add_constraint(self, constraint_type, columns, name=None):
         if constraint_type != constraint_utils.ConstraintType.UNIQUE.value:
@@ -335,11 +444,46 @@ class Table(DatabaseObject):
         constraint_oid = get_constraint_oid_by_name_and_table_oid(name, self.oid, engine)
         return Constraint.current_objects.create(oid=constraint_oid, table=self)
 
+    @staticmethod
+    def get_column_name_id_map_version_key(table_id):
+        return f"table_column_name_id_map_version_{table_id}"
+
+    @cached_property
+    def _column_name_id_bidirectional_map(self):
+        version_key = self.get_column_name_id_map_version_key(self.id)
+        version = _get_cache_version(version_key)
+        cache_key = f"table_column_name_id_map_{self.id}_{version}"
+        cached_map = cache.get(cache_key)
+        # Columns can be renamed directly in the database, or through another process with its
+        # own cache, so a cached map only counts if it was built from the same column names at
+        # the same attnums. Comparing names alone would miss two columns swapping names.
+        column_names_by_attnum = get_column_names_by_attnum(self.oid, self.schema._sa_engine)
+        if cached_map is None or cached_map['column_names_by_attnum'] != column_names_by_attnum:
+            columns = Column.objects.filter(table_id=self.id)
+            columns_map = {
+                column_names_by_attnum[column.attnum]: column.id
+                for column in columns if column.attnum in column_names_by_attnum
+            }
+            cached_map = {
+                'column_names_by_attnum': column_names_by_attnum, 'columns_map': columns_map
+            }
+            # Columns reflected while the map was built replace the version, and the map may
+            # predate them, so it's only stored if the version is still the one it's keyed by.
+            if cache.get(version_key) == version:
+                cache.set(cache_key, cached_map, NAME_CACHE_INTERVAL)
+        return bidict(cached_map['columns_map'])
+
     def get_column_name_id_bidirectional_map(self):
-        # TODO: Prefetch column names to avoid N+1 queries
-        columns = Column.objects.filter(table_id=self.id)
-        columns_map = bidict({column.name: column.id for column in columns})
-        return columns_map
+        """
+        The map is kept in the cache across requests and on the instance within one. Column
+        model changes and column changes made through this model clear it, and a cached map is
+        checked against the table's column names and attnums before it's used.
+        """
+        return self._column_name_id_bidirectional_map
+
+    def clear_column_name_id_map_cache(self):
+        self.__dict__.pop('_column_name_id_bidirectional_map', None)
+        cache.delete(self.get_column_name_id_map_version_key(self.id))
 
 
 class Column(ReflectionManagerMixin, BaseModel):
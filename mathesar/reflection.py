@@ -10,7 +10,6 @@ from db.tables.operations.select import get_table_oids_from_schema
 from mathesar import models
 from mathesar.api.serializers.shared_serializers import DisplayOptionsMappingSerializer, \
     DISPLAY_OPTIONS_SERIALIZER_MAPPING_KEY
-from mathesar.database.base import create_mathesar_engine
 
 DB_REFLECTION_KEY = 'database_reflected_recently'
 DB_REFLECTION_INTERVAL = 60 * 5  # we reflect DB changes every 5 minutes
@@ -41,7 +40,7 @@ def reflect_databases():
 
 
 def reflect_schemas_from_database(database):
-    engine = create_mathesar_engine(database)
+    engine = models.get_database_engine(database)
     db_schema_oids = {
         schema['oid'] for schema in get_mathesar_schemas_with_oids(engine)
     }
@@ -85,7 +84,7 @@ def reflect_columns_from_table(table):
 
 
 def reflect_constraints_from_database(database):
-    engine = create_mathesar_engine(database)
+    engine = models.get_database_engine(database)
     db_constraints = get_constraints_with_oids(engine)
     for db_constraint in db_constraints:
         try:
@@ -99,7 +98,7 @@ def reflect_constraints_from_database(database):
 
 
 def reflect_new_table_constraints(table):
-    engine = create_mathesar_engine(table.schema.database.name)
+    engine = table.schema._sa_engine
     db_constraints = get_constraints_with_oids(engine, table_oid=table.oid)
     constraints = [
         models.Constraint.current_objects.get_or_create(
@@ -1,7 +1,8 @@
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from mathesar.models import Table
+from mathesar.models import Column, Table
 from mathesar.reflection import reflect_new_table_constraints
 
 
@@ -11,3 +12,11 @@ def sync_table_constraints(**kwargs):
     # Constraint model instances for that table's constraints.
     if kwargs['created']:
         reflect_new_table_constraints(kwargs['instance'])
+
+
+@receiver(post_save, sender=Column)
+@receiver(post_delete, sender=Column)
+def clear_column_name_id_map_cache(**kwargs):
+    # Tables keep their column name to id map in the cache, so it has to be dropped when
+    # columns are reflected or removed.
+    cache.delete(Table.get_column_name_id_map_version_key(kwargs['instance'].table_id))
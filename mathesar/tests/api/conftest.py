@@ -3,6 +3,7 @@ import pytest
 from rest_framework.test import APIClient
 from sqlalchemy import text
 
+from db.columns.operations.select import get_column_names_by_attnum
 from mathesar.database.base import create_mathesar_engine
 from mathesar.imports.csv import create_table_from_csv
 from mathesar.models import DataFile
@@ -16,6 +17,27 @@ def client():
     return APIClient()
 
 
+@pytest.fixture
+def get_columns_by_name():
+    def _get_columns_by_name(table, name_list):
+        # Column names live in the database, so map the table's attnums to their names there in
+        # one query, and only fetch the wanted column models, along with the table, schema and
+        # database they reach the engine through. The columns are returned in the order of
+        # name_list, and a missing name raises a KeyError.
+        engine = table.schema._sa_engine
+        column_names_by_attnum = get_column_names_by_attnum(table.oid, engine)
+        attnums_by_name = {name: attnum for attnum, name in column_names_by_attnum.items()}
+        attnums = [attnums_by_name[name] for name in name_list]
+        columns_by_attnum = {
+            column.attnum: column
+            for column in table.columns.select_related('table__schema__database').filter(
+                attnum__in=attnums
+            )
+        }
+        return [columns_by_attnum[attnum] for attnum in attnums]
+    return _get_columns_by_name
+
+
 @pytest.fixture
 def create_data_file():
     def _create_data_file(file_path, file_name):
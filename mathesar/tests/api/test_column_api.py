@@ -41,13 +41,6 @@ def column_test_table(patent_schema):
     return table
 
 
-def _get_columns_by_name(table, name_list):
-    columns_by_name_dict = {
-        col.name: col for col in ServiceLayerColumn.objects.filter(table=table) if col.name in name_list
-    }
-    return [columns_by_name_dict[col_name] for col_name in name_list]
-
-
 @pytest.fixture
 def column_test_table_with_service_layer_options(patent_schema):
     engine = patent_schema._sa_engine
@@ -428,11 +421,11 @@ def test_column_create_name_parameter_empty(column_test_table, client):
     assert actual_new_col["type"] == type_
 
 
-def test_column_update_name(column_test_table, client):
+def test_column_update_name(column_test_table, client, get_columns_by_name):
     cache.clear()
     name = "updatedname"
     data = {"name": name}
-    column = _get_columns_by_name(column_test_table, ['mycolumn1'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn1'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
     )
@@ -445,10 +438,10 @@ def test_column_update_name(column_test_table, client):
     assert response.json()["name"] == name
 
 
-def test_column_update_display_options(column_test_table_with_service_layer_options, client):
+def test_column_update_display_options(column_test_table_with_service_layer_options, client, get_columns_by_name):
     cache.clear()
     table, columns = column_test_table_with_service_layer_options
-    column = _get_columns_by_name(table, ['mycolumn1'])[0]
+    column = get_columns_by_name(table, ['mycolumn1'])[0]
     column_id = column.id
     display_options = {"input": "dropdown", "custom_labels": {"TRUE": "yes", "FALSE": "no"}}
     display_options_data = {"display_options": display_options}
@@ -486,11 +479,11 @@ def test_column_invalid_display_options_type_on_reflection(column_test_table_wit
     assert response.json()["display_options"] is None
 
 
-def test_column_update_default(column_test_table, client):
+def test_column_update_default(column_test_table, client, get_columns_by_name):
     cache.clear()
     expt_default = 5
     data = {"default": {"value": expt_default}}  # Ensure we pass a int and not a str
-    column = _get_columns_by_name(column_test_table, ['mycolumn0'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn0'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data=json.dumps(data),
@@ -499,11 +492,11 @@ def test_column_update_default(column_test_table, client):
     assert response.json()["default"]["value"] == expt_default
 
 
-def test_column_update_delete_default(column_test_table, client):
+def test_column_update_delete_default(column_test_table, client, get_columns_by_name):
     cache.clear()
     expt_default = None
     data = {"default": None}
-    column = _get_columns_by_name(column_test_table, ['mycolumn0'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn0'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data=data,
@@ -511,10 +504,10 @@ def test_column_update_delete_default(column_test_table, client):
     assert response.json()["default"] == expt_default
 
 
-def test_column_update_default_invalid_cast(column_test_table, client):
+def test_column_update_default_invalid_cast(column_test_table, client, get_columns_by_name):
     cache.clear()
     data = {"default": {"value": "not an integer"}}
-    column = _get_columns_by_name(column_test_table, ['mycolumn0'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn0'])[0]
 
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
@@ -524,34 +517,34 @@ def test_column_update_default_invalid_cast(column_test_table, client):
     assert response.status_code == 400
 
 
-def test_column_update_type_dynamic_default(column_test_table, client):
+def test_column_update_type_dynamic_default(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "NUMERIC"
     data = {"type": type_}
-    column = _get_columns_by_name(column_test_table, ['mycolumn0'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn0'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
     )
     assert response.status_code == 400
 
 
-def test_column_update_type(column_test_table, client):
+def test_column_update_type(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "BOOLEAN"
     data = {"type": type_}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
     )
     assert response.json()["type"] == type_
 
 
-def test_column_update_name_and_type(column_test_table, client):
+def test_column_update_name_and_type(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "BOOLEAN"
     new_name = 'new name'
     data = {"type": type_, "name": new_name}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
     )
@@ -559,12 +552,12 @@ def test_column_update_name_and_type(column_test_table, client):
     assert response.json()["name"] == new_name
 
 
-def test_column_update_name_type_nullable(column_test_table, client):
+def test_column_update_name_type_nullable(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "BOOLEAN"
     new_name = 'new name'
     data = {"type": type_, "name": new_name, "nullable": True}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
 
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
@@ -574,7 +567,7 @@ def test_column_update_name_type_nullable(column_test_table, client):
     assert response.json()["nullable"] is True
 
 
-def test_column_update_name_type_nullable_default(column_test_table, client):
+def test_column_update_name_type_nullable_default(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "BOOLEAN"
     new_name = 'new name'
@@ -584,7 +577,7 @@ def test_column_update_name_type_nullable_default(column_test_table, client):
         "nullable": True,
         "default": {"value": True},
     }
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data=json.dumps(data),
@@ -596,12 +589,12 @@ def test_column_update_name_type_nullable_default(column_test_table, client):
     assert response.json()["default"]["value"] is True
 
 
-def test_column_update_type_options(column_test_table, client):
+def test_column_update_type_options(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "NUMERIC"
     type_options = {"precision": 3, "scale": 1}
     data = {"type": type_, "type_options": type_options}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data,
@@ -610,11 +603,11 @@ def test_column_update_type_options(column_test_table, client):
     assert response.json()["type_options"] == type_options
 
 
-def test_column_update_type_options_no_type(column_test_table, client):
+def test_column_update_type_options_no_type(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "NUMERIC"
     data = {"type": type_}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data,
@@ -648,11 +641,11 @@ def test_column_update_invalid_type(create_table, client, engine_email_type):
     assert response_json[0]['message'] == "This type casting is invalid."
 
 
-def test_column_update_returns_table_dependent_fields(column_test_table, client):
+def test_column_update_returns_table_dependent_fields(column_test_table, client, get_columns_by_name):
     cache.clear()
     expt_default = 5
     data = {"default": {"value": expt_default}}
-    column = _get_columns_by_name(column_test_table, ['mycolumn1'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn1'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data=data,
@@ -662,11 +655,11 @@ def test_column_update_returns_table_dependent_fields(column_test_table, client)
 
 
 @pytest.mark.parametrize("type_options", invalid_type_options)
-def test_column_update_type_invalid_options(column_test_table, client, type_options):
+def test_column_update_type_invalid_options(column_test_table, client, type_options, get_columns_by_name):
     cache.clear()
     type_ = "NUMERIC"
     data = {"type": type_, "type_options": type_options}
-    column = _get_columns_by_name(column_test_table, ['mycolumn3'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn3'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/",
         data=data,
@@ -674,11 +667,11 @@ def test_column_update_type_invalid_options(column_test_table, client, type_opti
     assert response.status_code == 400
 
 
-def test_column_update_type_invalid_cast(column_test_table, client):
+def test_column_update_type_invalid_cast(column_test_table, client, get_columns_by_name):
     cache.clear()
     type_ = "MATHESAR_TYPES.EMAIL"
     data = {"type": type_}
-    column = _get_columns_by_name(column_test_table, ['mycolumn1'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn1'])[0]
     response = client.patch(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/", data=data
     )
@@ -698,11 +691,11 @@ def test_column_update_when_missing(column_test_table, client):
     assert response_data['code'] == ErrorCodes.NotFound.value
 
 
-def test_column_destroy(column_test_table, client):
+def test_column_destroy(column_test_table, client, get_columns_by_name):
     cache.clear()
     num_columns = len(column_test_table.sa_columns)
     col_one_name = column_test_table.sa_columns[1].name
-    column = _get_columns_by_name(column_test_table, ['mycolumn1'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn1'])[0]
     response = client.delete(
         f"/api/db/v0/tables/{column_test_table.id}/columns/{column.id}/"
     )
@@ -726,9 +719,9 @@ def test_column_destroy_when_missing(column_test_table, client):
     assert response.status_code == 404
 
 
-def test_column_duplicate(column_test_table, client):
+def test_column_duplicate(column_test_table, client, get_columns_by_name):
     cache.clear()
-    column = _get_columns_by_name(column_test_table, ['mycolumn1'])[0]
+    column = get_columns_by_name(column_test_table, ['mycolumn1'])[0]
     target_col = column_test_table.sa_columns[column.name]
     data = {
         "name": "new_col_name",
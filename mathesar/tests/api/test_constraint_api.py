@@ -1,4 +1,5 @@
 import json
+
 from mathesar.api.exceptions.error_codes import ErrorCodes
 
 
@@ -17,17 +18,10 @@ def _verify_unique_constraint(constraint_data, columns, name):
     assert 'id' in constraint_data and type(constraint_data['id']) == int
 
 
-def _get_columns_by_name(table, name_list):
-    columns_by_name_dict = {
-        col.name: col for col in table.columns.all() if col.name in name_list
-    }
-    return [columns_by_name_dict[col_name] for col_name in name_list]
-
-
-def test_default_constraint_list(create_table, client):
+def test_default_constraint_list(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 0'
     table = create_table(table_name)
-    constraint_column_id = _get_columns_by_name(table, ['id'])[0].id
+    constraint_column_id = get_columns_by_name(table, ['id'])[0].id
 
     response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
     response_data = response.json()
@@ -41,10 +35,10 @@ def test_default_constraint_list(create_table, client):
     assert constraint_data['type'] == 'primary'
 
 
-def test_multiple_constraint_list(create_table, client):
+def test_multiple_constraint_list(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 1'
     table = create_table(table_name)
-    constraint_column = _get_columns_by_name(table, ['Case Number'])[0]
+    constraint_column = get_columns_by_name(table, ['Case Number'])[0]
     table.add_constraint('unique', [constraint_column])
 
     response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
@@ -56,12 +50,12 @@ def test_multiple_constraint_list(create_table, client):
             _verify_unique_constraint(constraint_data, [constraint_column.id], 'NASA Constraint List 1_Case Number_key')
 
 
-def test_multiple_column_constraint_list(create_table, client):
+def test_multiple_column_constraint_list(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 2'
     table = create_table(table_name)
-    constraint_columns = _get_columns_by_name(table, ['Center', 'Case Number'])
-    constraint_column_id_list = [constraint_columns[0].id, constraint_columns[1].id]
-    table.add_constraint('unique', [constraint_columns[0], constraint_columns[1]])
+    center_column, case_number_column = get_columns_by_name(table, ['Center', 'Case Number'])
+    constraint_column_id_list = [center_column.id, case_number_column.id]
+    table.add_constraint('unique', [center_column, case_number_column])
 
     response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
     response_data = response.json()
@@ -72,10 +66,10 @@ def test_multiple_column_constraint_list(create_table, client):
             _verify_unique_constraint(constraint_data, constraint_column_id_list, 'NASA Constraint List 2_Center_key')
 
 
-def test_retrieve_constraint(create_table, client):
+def test_retrieve_constraint(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 3'
     table = create_table(table_name)
-    constraint_column = _get_columns_by_name(table, ['Case Number'])[0]
+    constraint_column = get_columns_by_name(table, ['Case Number'])[0]
     constraint_column_id_list = [constraint_column.id]
     table.add_constraint('unique', [constraint_column])
     list_response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
@@ -91,13 +85,11 @@ def test_retrieve_constraint(create_table, client):
     _verify_unique_constraint(response.json(), constraint_column_id_list, 'NASA Constraint List 3_Case Number_key')
 
 
-def test_create_multiple_column_unique_constraint(create_table, client):
+def test_create_multiple_column_unique_constraint(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 4'
     table = create_table(table_name)
-    constraint_columns = _get_columns_by_name(table, ['Center', 'Case Number'])
-    constraint_column_1 = constraint_columns[0]
-    constraint_column_2 = constraint_columns[1]
-    constraint_column_id_list = [constraint_column_1.id, constraint_column_2.id]
+    center_column, case_number_column = get_columns_by_name(table, ['Center', 'Case Number'])
+    constraint_column_id_list = [center_column.id, case_number_column.id]
     data = {
         'type': 'unique',
         'columns': constraint_column_id_list
@@ -111,10 +103,10 @@ def test_create_multiple_column_unique_constraint(create_table, client):
     _verify_unique_constraint(response.json(), constraint_column_id_list, 'NASA Constraint List 4_Center_key')
 
 
-def test_create_single_column_unique_constraint(create_table, client):
+def test_create_single_column_unique_constraint(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 5'
     table = create_table(table_name)
-    constraint_column_id = _get_columns_by_name(table, ['Case Number'])[0].id
+    constraint_column_id = get_columns_by_name(table, ['Case Number'])[0].id
     data = {
         'type': 'unique',
         'columns': [constraint_column_id]
@@ -128,10 +120,10 @@ def test_create_single_column_unique_constraint(create_table, client):
     _verify_unique_constraint(response.json(), [constraint_column_id], 'NASA Constraint List 5_Case Number_key')
 
 
-def test_create_unique_constraint_with_name_specified(create_table, client):
+def test_create_unique_constraint_with_name_specified(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 6'
     table = create_table(table_name)
-    constraint_columns = _get_columns_by_name(table, ['Case Number'])
+    constraint_columns = get_columns_by_name(table, ['Case Number'])
     constraint_column_id_list = [constraint_columns[0].id]
     data = {
         'name': 'awesome_constraint',
@@ -147,11 +139,11 @@ def test_create_unique_constraint_with_name_specified(create_table, client):
     _verify_unique_constraint(response.json(), constraint_column_id_list, 'awesome_constraint')
 
 
-def test_drop_constraint(create_table, client):
+def test_drop_constraint(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 7'
     table = create_table(table_name)
 
-    constraint_column = _get_columns_by_name(table, ['Case Number'])[0]
+    constraint_column = get_columns_by_name(table, ['Case Number'])[0]
     table.add_constraint('unique', [constraint_column])
     list_response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
     list_response_data = list_response.json()
@@ -167,12 +159,12 @@ def test_drop_constraint(create_table, client):
     assert new_list_response.json()['count'] == 1
 
 
-def test_create_unique_constraint_with_duplicate_name(create_table, client):
+def test_create_unique_constraint_with_duplicate_name(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 8'
     table = create_table(table_name)
-    constraint_columns = _get_columns_by_name(table, ['Center', 'Case Number'])
-    constraint_column_id_list = [constraint_columns[0].id, constraint_columns[1].id]
-    table.add_constraint('unique', [constraint_columns[0], constraint_columns[1]])
+    center_column, case_number_column = get_columns_by_name(table, ['Center', 'Case Number'])
+    constraint_column_id_list = [center_column.id, case_number_column.id]
+    table.add_constraint('unique', [center_column, case_number_column])
     data = {
         'type': 'unique',
         'columns': constraint_column_id_list
@@ -188,10 +180,10 @@ def test_create_unique_constraint_with_duplicate_name(create_table, client):
     assert response_body['code'] == ErrorCodes.DuplicateTableError.value
 
 
-def test_create_unique_constraint_for_non_unique_column(create_table, client):
+def test_create_unique_constraint_for_non_unique_column(create_table, client, get_columns_by_name):
     table_name = 'NASA Constraint List 9'
     table = create_table(table_name)
-    constraint_column = _get_columns_by_name(table, ['Center'])[0]
+    constraint_column = get_columns_by_name(table, ['Center'])[0]
     data = {
         'type': 'unique',
         'columns': [constraint_column.id]
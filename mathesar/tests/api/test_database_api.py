@@ -201,3 +201,18 @@ def test_database_detail(client):
 
     assert response.status_code == 200
     check_database(expected_database, response_database)
+
+
+def test_database_pool_status(client):
+    database = Database.objects.get()
+
+    response = client.get(f'/api/db/v0/databases/{database.id}/pool_status/')
+    response_data = response.json()
+
+    # The engine's pool is shared by the whole process, so the connection counts depend on what
+    # else is using it.
+    assert response.status_code == 200
+    assert response_data['size'] == settings.MATHESAR_DB_POOL_SIZE
+    for key in ['checked_in', 'checked_out', 'overflow']:
+        assert type(response_data[key]) is int
+    assert type(response_data['status']) is str
@@ -0,0 +1,72 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from mathesar.utils.json import MathesarJSONEncoder, MathesarJSONRenderer, dumps
+
+
+renderer = MathesarJSONRenderer()
+
+
+def _stdlib_dumps(data):
+    return json.dumps(
+        data, cls=MathesarJSONEncoder, ensure_ascii=False, separators=(',', ':')
+    ).encode()
+
+
+def test_render_matches_stdlib_encoding():
+    data = {
+        'text': 'ünïcode',
+        'integer': 12,
+        'decimal': Decimal('1.5'),
+        'date': datetime.date(2021, 1, 2),
+        'time': datetime.time(1, 2, 3),
+        'datetime': datetime.datetime(2021, 1, 2, 3, 4, 5),
+        'list': [1, None, True],
+    }
+    assert renderer.render(data) == _stdlib_dumps(data)
+    assert dumps(data) == _stdlib_dumps(data)
+
+
+def test_render_integer_keys():
+    assert renderer.render({1: 'a'}) == b'{"1":"a"}'
+
+
+@pytest.mark.parametrize('encode', [renderer.render, dumps])
+def test_render_integers_beyond_64_bits(encode):
+    big_integer = 2 ** 64 + 1
+    data = {'value': big_integer, 'json': {'nested': [-big_integer]}}
+    assert encode(data) == _stdlib_dumps(data)
+
+
+@pytest.mark.parametrize('encode', [renderer.render, dumps])
+def test_render_escapes_line_separators(encode):
+    assert encode({'value': 'a\u2028b\u2029c'}) == b'{"value":"a\\u2028b\\u2029c"}'
+
+
+def test_render_escapes_line_separators_in_fallback():
+    encoded = renderer.render({'value': '\u2028', 'integer': 2 ** 64})
+    assert encoded == b'{"value":"\\u2028","integer":18446744073709551616}'
+
+
+def test_render_indented():
+    data = {'value': [1, 2], 'date': datetime.date(2021, 1, 2)}
+    encoded = renderer.render(data, 'application/json; indent=4')
+    assert b'\n    ' in encoded
+    assert json.loads(encoded) == {'value': [1, 2], 'date': '2021-01-02'}
+
+
+def test_render_none():
+    assert renderer.render(None) == b''
+    assert dumps(None) == b'null'
+
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf')])
+def test_render_non_finite_floats_as_null(value):
+    # The stdlib based encoding rejects these, orjson encodes them as null.
+    with pytest.raises(ValueError):
+        super(MathesarJSONRenderer, renderer).render({'value': value})
+    assert renderer.render({'value': value}) == b'{"value":null}'
+    assert dumps({'value': value}) == b'{"value":null}'
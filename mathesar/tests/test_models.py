@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch
 from django.core.cache import cache
+from sqlalchemy import text
 
 from mathesar import models
 from mathesar import reflection
@@ -62,3 +63,92 @@ def test_model_current_queryset_does_not_reflects_db_objects(model):
     with patch.object(reflection, 'reflect_db_objects') as mock_reflect:
         model.current_objects.all()
     mock_reflect.assert_not_called()
+
+
+def test_table_num_records_uses_cache(create_table):
+    table = create_table('NASA Num Records Cache')
+    filter = {"empty": [{"column_name": ["Center"]}]}
+    with patch.object(models, 'get_count', return_value=0) as mock_count:
+        count_one = table.get_cached_num_records(filter=filter)
+        count_two = table.get_cached_num_records(filter=filter)
+    assert count_one == count_two
+    assert mock_count.call_count == 1
+
+
+def test_table_num_records_cache_cleared_on_write(create_table):
+    table = create_table('NASA Num Records Cache Clear')
+    original_num_records = table.get_cached_num_records()
+    table.delete_record(1)
+    assert table.get_cached_num_records() == original_num_records - 1
+
+
+def test_table_column_name_id_map_cleared_on_column_change(create_table):
+    table = create_table('NASA Column Map Cache Clear')
+    original_map = table.get_column_name_id_bidirectional_map()
+    assert table.get_column_name_id_bidirectional_map() is original_map
+    table.add_column({"name": "New Column", "type": "TEXT"})
+    assert table.get_column_name_id_bidirectional_map() is not original_map
+
+
+def test_table_column_name_id_map_follows_column_rename(create_table):
+    table = create_table('NASA Column Map Rename')
+    columns_map = table.get_column_name_id_bidirectional_map()
+    column = models.Column.current_objects.get(id=columns_map['Center'])
+    table.alter_column(column.attnum, {'name': 'Centre'})
+    same_table = models.Table.current_objects.get(id=table.id)
+    for table_instance in [table, same_table]:
+        renamed_columns_map = table_instance.get_column_name_id_bidirectional_map()
+        assert renamed_columns_map['Centre'] == column.id
+        assert 'Center' not in renamed_columns_map
+
+
+def test_table_column_name_id_map_cleared_on_column_save(create_table):
+    table = create_table('NASA Column Map Signal')
+    columns_map = table.get_column_name_id_bidirectional_map()
+    version_key = models.Table.get_column_name_id_map_version_key(table.id)
+    assert cache.get(version_key) is not None
+    column = models.Column.current_objects.get(id=columns_map['Center'])
+    column.save()
+    assert cache.get(version_key) is None
+
+
+def test_table_column_name_id_map_not_stored_under_replaced_version(create_table):
+    table = create_table('NASA Column Map Version')
+    table.clear_column_name_id_map_cache()
+    version_key = models.Table.get_column_name_id_map_version_key(table.id)
+    filter_columns = models.Column.objects.filter
+
+    def _filter_columns_during_reflection(*args, **kwargs):
+        cache.delete(version_key)
+        return filter_columns(*args, **kwargs)
+
+    version = models._get_cache_version(version_key)
+    with patch.object(models.Column.objects, 'filter', side_effect=_filter_columns_during_reflection):
+        columns_map = table.get_column_name_id_bidirectional_map()
+    assert 'Center' in columns_map
+    assert cache.get(f"table_column_name_id_map_{table.id}_{version}") is None
+
+
+def test_table_column_name_id_map_uses_cache(create_table):
+    table = create_table('NASA Column Map Cache')
+    columns_map = table.get_column_name_id_bidirectional_map()
+    same_table = models.Table.current_objects.get(id=table.id)
+    with patch.object(models.Column, 'objects') as mock_objects:
+        same_table_columns_map = same_table.get_column_name_id_bidirectional_map()
+    assert same_table_columns_map == columns_map
+    assert mock_objects.filter.call_count == 0
+
+
+def test_table_column_name_id_map_detects_swapped_names(create_table):
+    table = create_table('NASA Column Map Swap')
+    columns_map = table.get_column_name_id_bidirectional_map()
+    engine = table.schema._sa_engine
+    table_name = f'"{table.schema.name}"."{table.name}"'
+    with engine.begin() as conn:
+        conn.execute(text(f'ALTER TABLE {table_name} RENAME COLUMN "Center" TO "Swap"'))
+        conn.execute(text(f'ALTER TABLE {table_name} RENAME COLUMN "Status" TO "Center"'))
+        conn.execute(text(f'ALTER TABLE {table_name} RENAME COLUMN "Swap" TO "Status"'))
+    same_table = models.Table.current_objects.get(id=table.id)
+    same_table_columns_map = same_table.get_column_name_id_bidirectional_map()
+    assert same_table_columns_map['Center'] == columns_map['Status']
+    assert same_table_columns_map['Status'] == columns_map['Center']
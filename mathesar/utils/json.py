@@ -1,5 +1,6 @@
 import datetime
 
+import orjson
 from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.renderers import JSONRenderer
 
@@ -15,5 +16,49 @@ class MathesarJSONEncoder(JSONEncoder):
             return super().default(obj)
 
 
+_encoder = MathesarJSONEncoder()
+
+
+def _orjson_dumps(data):
+    encoded = orjson.dumps(
+        data,
+        default=_encoder.default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+    # Like DRF's JSONRenderer, escape the line and paragraph separators, which are valid in JSON
+    # strings but not in JavaScript ones.
+    if b'\xe2\x80\xa8' in encoded or b'\xe2\x80\xa9' in encoded:
+        encoded = encoded.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return encoded
+
+
 class MathesarJSONRenderer(JSONRenderer):
     encoder_class = MathesarJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        # Indented output is only asked for by the browsable API, leave it to the stdlib encoder.
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return _orjson_dumps(data)
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson can't encode integers beyond 64 bits, which the stdlib encoder can.
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+_renderer = MathesarJSONRenderer()
+
+
+def dumps(data):
+    """
+    Encodes data to JSON bytes with orjson. Dates, times and types orjson doesn't know (e.g.
+    Decimal) are passed through to MathesarJSONEncoder. Data orjson can't encode at all, such as
+    integers beyond 64 bits, is encoded by DRF's JSONRenderer instead.
+    """
+    try:
+        return _orjson_dumps(data)
+    except (orjson.JSONEncodeError, TypeError):
+        return super(MathesarJSONRenderer, _renderer).render(data)